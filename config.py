@@ -1,13 +1,17 @@
+import functools
 import os
 from dataclasses import dataclass, field
 
-# Load .env file for local development only (not needed in Lambda)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # dotenv not available in Lambda environment, which is fine
-    pass
+# Load .env file for local development only. AWS sets AWS_EXECUTION_ENV in
+# every Lambda runtime, so inside Lambda we skip the dotenv import and its
+# filesystem probes entirely — the runtime injects the environment for us.
+if os.getenv("AWS_EXECUTION_ENV") is None:
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        # dotenv not installed locally, which is fine
+        pass
 
 
 class ConfigurationError(RuntimeError):
@@ -22,8 +26,14 @@ class Config:
     cors_allowed_origin: str = field(default_factory=lambda: os.getenv("CORS_ALLOWED_ORIGIN", "*"))
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def load(cls) -> "Config":
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables.
+
+        The resolved Config is cached for the container lifetime so repeated
+        calls skip the env lookups and dataclass default factories. A failed
+        load is not cached and is retried on the next call.
+        """
         arn = os.getenv("LOGICAL_SEARCH_STATE_MACHINE_ARN", "").strip()
         if not arn:
             raise ConfigurationError("LOGICAL_SEARCH_STATE_MACHINE_ARN environment variable is required")
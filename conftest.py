@@ -0,0 +1,13 @@
+import os
+import sys
+
+# Make the function modules importable from the repo root. Lives here so
+# pytest applies it once per session instead of each test file mutating
+# sys.path at import time.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# test_lambda.py is a manual smoke script for invoking the handler against a
+# real environment, not a pytest suite: collected, its functions swallow every
+# failure and return None, so they report green no matter what the handler
+# does. Run it directly with `python test_lambda.py` instead.
+collect_ignore = ["test_lambda.py"]
@@ -1,11 +1,11 @@
-import json
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional
 
 from config import Config, ConfigurationError
 from logging_config import get_logger
 from request_parser import RequestValidationError, parse_event
 from stepfunctions_client import StepFunctionsExecutor, WorkflowStartError
+from utils import json_dumps_bytes
 
 logger = get_logger(__name__)
 
@@ -14,13 +14,21 @@ _executor: Optional[StepFunctionsExecutor] = None
 
 def lambda_handler(event: Optional[Dict[str, Any]], context: Any) -> Dict[str, Any]:
     """AWS Lambda entrypoint triggered by API Gateway."""
+    if _is_warmer_ping(event):
+        # EventBridge keep-warm ping: return before any parse/validate work
+        # so scheduled pings keep the container resident at near-zero cost.
+        return {"statusCode": 204}
+
     if _is_options_request(event):
-        return _build_response(204, {})
+        return _options_response()
 
     try:
-        config, executor = _get_runtime_dependencies()
+        config = _get_config()
         execution_request = parse_event(event or {}, config)
 
+        # Executor (and with it the boto3 client/import) is only touched once
+        # validation has succeeded, keeping error paths free of that cost.
+        executor = _get_executor(config)
         trace_header = _extract_trace_header(event)
         response = executor.start_execution(execution_request, trace_header=trace_header)
 
@@ -62,17 +70,21 @@ def lambda_handler(event: Optional[Dict[str, Any]], context: Any) -> Dict[str, A
         return _build_response(500, {"success": False, "error": "Internal server error"})
 
 
-def _get_runtime_dependencies() -> Tuple[Config, StepFunctionsExecutor]:
-    global _config, _executor
+def _get_config() -> Config:
+    global _config
+
+    # Config.load() is memoized, so this is a cache hit after the first call.
+    _config = Config.load()
+    return _config
+
+
+def _get_executor(config: Config) -> StepFunctionsExecutor:
+    global _executor
 
-    if _config is None:
-        _config = Config.load()
-        logger.debug("Configuration loaded for state machine %s", _config.state_machine_arn)
     if _executor is None:
-        _executor = StepFunctionsExecutor(_config)
+        _executor = StepFunctionsExecutor(config)
         logger.debug("Step Functions client initialised")
-
-    return _config, _executor
+    return _executor
 
 
 def _extract_trace_header(event: Optional[Dict[str, Any]]) -> Optional[str]:
@@ -85,33 +97,68 @@ def _extract_trace_header(event: Optional[Dict[str, Any]]) -> Optional[str]:
     return headers.get("X-Amzn-Trace-Id") or headers.get("x-amzn-trace-id")
 
 
+def _is_warmer_ping(event: Optional[Dict[str, Any]]) -> bool:
+    if not event or not isinstance(event, dict):
+        return False
+    return event.get("source") == "aws.events" and event.get("detail-type") == "Scheduled Event"
+
+
 def _is_options_request(event: Optional[Dict[str, Any]]) -> bool:
     if not event or not isinstance(event, dict):
         return False
-    method = event.get("httpMethod") or event.get("requestContext", {}).get("httpMethod")
+    method = event.get("httpMethod")
+    if not method:
+        request_context = event.get("requestContext")
+        method = request_context.get("httpMethod") if isinstance(request_context, dict) else None
     return isinstance(method, str) and method.upper() == "OPTIONS"
 
 
-def _build_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+# Response headers cached per resolved CORS origin; the origin is stable for
+# the container lifetime once configuration has loaded, so in practice this
+# holds a single entry.
+_headers_by_origin: Dict[str, Dict[str, str]] = {}
+
+
+def _response_headers() -> Dict[str, str]:
     cors_origin = _get_cors_origin()
-    headers = {
-        "Content-Type": "application/json",
-        "Access-Control-Allow-Origin": cors_origin,
-        "Access-Control-Allow-Headers": "Content-Type,Authorization,X-Requested-With",
-        "Access-Control-Allow-Methods": "OPTIONS,POST",
-    }
+    headers = _headers_by_origin.get(cors_origin)
+    if headers is None:
+        headers = {
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": cors_origin,
+            "Access-Control-Allow-Headers": "Content-Type,Authorization,X-Requested-With",
+            "Access-Control-Allow-Methods": "OPTIONS,POST",
+        }
+        _headers_by_origin[cors_origin] = headers
+    return headers
+
 
-    if status_code == 204:
-        return {
-            "statusCode": status_code,
+# CORS preflight responses are identical for the container lifetime, so the
+# whole response dict is cached alongside the headers, keyed the same way.
+_options_response_by_origin: Dict[str, Dict[str, Any]] = {}
+
+
+def _options_response() -> Dict[str, Any]:
+    headers = _response_headers()
+    cors_origin = headers["Access-Control-Allow-Origin"]
+    response = _options_response_by_origin.get(cors_origin)
+    if response is None:
+        response = {
+            "statusCode": 204,
             "headers": headers,
             "body": "",
         }
+        _options_response_by_origin[cors_origin] = response
+    return response
+
+
+def _build_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    headers = _response_headers()
 
     return {
         "statusCode": status_code,
         "headers": headers,
-        "body": json.dumps(body),
+        "body": json_dumps_bytes(body).decode("utf-8"),
     }
 
 
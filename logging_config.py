@@ -2,6 +2,34 @@ import logging
 import os
 from typing import Any
 
+_configured = False
+
+
+def _configure_root_once() -> None:
+    """
+    Configure the root logger a single time per process.
+
+    Module loggers propagate to the root handler, so per-module handler
+    setup (and the duplicate records it can cause) is avoided entirely. In
+    Lambda the runtime pre-installs a root handler that already writes to
+    CloudWatch; basicConfig is a no-op there and only the level is applied.
+    """
+    global _configured
+    if _configured:
+        return
+
+    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+    level = getattr(logging, log_level, logging.INFO)
+
+    # No %(asctime)s: it costs a strftime/localtime call per record, and both
+    # the Lambda runtime and CloudWatch already stamp every log line.
+    logging.basicConfig(
+        level=level,
+        format='%(name)s - %(levelname)s - %(message)s',
+    )
+    logging.getLogger().setLevel(level)
+    _configured = True
+
 
 def get_logger(name: str) -> Any:
     """
@@ -13,24 +41,5 @@ def get_logger(name: str) -> Any:
     Returns:
         Configured logger
     """
-    logger = logging.getLogger(name)
-
-    if not logger.handlers:
-        # Configure logging level
-        log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        logger.setLevel(getattr(logging, log_level, logging.INFO))
-
-        # Create console handler
-        handler = logging.StreamHandler()
-        handler.setLevel(logger.level)
-
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-
-        # Add handler to logger
-        logger.addHandler(handler)
-
-    return logger
\ No newline at end of file
+    _configure_root_once()
+    return logging.getLogger(name)
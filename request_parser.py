@@ -1,18 +1,30 @@
 import base64
-import json
-import uuid
+import secrets
+import time
+from collections import ChainMap
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from config import Config
+from utils import json_loads
 
 
 class RequestValidationError(ValueError):
     """Raised when the incoming request payload is invalid."""
 
 
-@dataclass
+# Default pipeline flags; merged beneath caller-provided flags per request.
+_DEFAULT_FLAGS = {
+    'hyde_provider': 'groq_llama',
+    'description_provider': 'groq_llama',
+    'reasoning_model': 'groq_llama',
+    'alternative_skills': False,
+    'reasoning': False,
+    'fallback': False,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SearchExecutionRequest:
     search_id: str
     user_id: str
@@ -46,24 +58,17 @@ def parse_event(event: Dict[str, Any], config: Config) -> SearchExecutionRequest
     query = _require_non_empty_string(body, "query")
     flags = body.get("flags", {})
 
-    # Set default flags
-    default_flags = {
-        'hyde_provider': 'groq_llama',
-        'description_provider': 'groq_llama',
-        'reasoning_model': 'groq_llama',
-        'alternative_skills': False,
-        'reasoning': False,
-        'fallback': False
-    }
-
-    # Merge with provided flags
-    final_flags = {**default_flags, **flags}
+    # Layer provided flags over the defaults; the single dict() call
+    # materializes the merge once, at the serialization boundary. Deeper
+    # flag layering later only adds maps to the chain, not copies.
+    final_flags = dict(ChainMap(flags, _DEFAULT_FLAGS)) if flags else dict(_DEFAULT_FLAGS)
 
-    # Generate unique search ID
-    search_id = str(uuid.uuid4())
+    # Generate unique search ID: 128 bits of hex straight from os.urandom,
+    # with no intermediate UUID object
+    search_id = secrets.token_hex(16)
 
-    # Generate timestamp
-    initiated_at = datetime.now(timezone.utc).isoformat()
+    # Generate timestamp (time.strftime avoids datetime object construction)
+    initiated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     return SearchExecutionRequest(
         search_id=search_id,
@@ -84,15 +89,17 @@ def _extract_body(event: Dict[str, Any]) -> Dict[str, Any]:
 
     body = event.get("body", "")
     if event.get("isBase64Encoded") and isinstance(body, str):
-        body = base64.b64decode(body).decode("utf-8")
+        # Keep the decoded bytes as-is; the JSON parser accepts bytes
+        # directly, saving a UTF-8 decode per request.
+        body = base64.b64decode(body)
 
-    if isinstance(body, str):
+    if isinstance(body, (str, bytes)):
         body = body.strip()
         if not body:
             return {}
         try:
-            return json.loads(body)
-        except json.JSONDecodeError as exc:
+            return json_loads(body)
+        except ValueError as exc:
             raise RequestValidationError("Request body must be valid JSON") from exc
 
     if isinstance(body, dict):
@@ -107,7 +114,8 @@ def _require_non_empty_string(payload: Dict[str, Any], field_name: str) -> str:
     if value is None:
         raise RequestValidationError(f"{field_name} is required")
 
-    value_str = str(value).strip()
+    # Fast path: values are almost always str already; skip the str() rewrap.
+    value_str = value.strip() if isinstance(value, str) else str(value).strip()
     if not value_str:
         raise RequestValidationError(f"{field_name} cannot be empty")
 
@@ -1,22 +1,75 @@
-import json
-from typing import Any, Dict, Optional
-
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+from typing import Any, Dict, Optional, Tuple
 
 from config import Config
 from request_parser import SearchExecutionRequest
-from utils import build_execution_name
+from utils import UNSAFE_NAME_CHARS, json_dumps
+
+# Bound method reference so the hot path skips the attribute lookup.
+_strip_unsafe_name_chars = UNSAFE_NAME_CHARS.sub
+
+# boto3/botocore are imported lazily: a Lambda cold start pays the import
+# exactly once when the shared client is first built, while callers that
+# inject their own client (unit tests) skip the ~300ms import entirely.
 
 
 class WorkflowStartError(RuntimeError):
     """Raised when the Step Functions execution could not be started."""
 
 
+_default_client: Optional[Any] = None
+
+
+def _get_default_client() -> Any:
+    """Return the shared Step Functions client, creating it on first use.
+
+    Client construction is expensive (botocore session, service model,
+    endpoint resolution), so the client is built once per container and
+    reused by every executor instead of once per instance.
+    """
+    global _default_client
+    if _default_client is None:
+        import boto3
+
+        _default_client = boto3.client("stepfunctions")
+        _warm_client(_default_client)
+    return _default_client
+
+
+_aws_errors: Optional[Tuple[type, ...]] = None
+
+
+def _aws_error_types() -> Tuple[type, ...]:
+    """Return the botocore exception types to translate, importing once."""
+    global _aws_errors
+    if _aws_errors is None:
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        _aws_errors = (BotoCoreError, ClientError)
+    return _aws_errors
+
+
+def _warm_client(client: Any) -> None:
+    """Force botocore's lazy per-operation setup to happen up front.
+
+    The first call on a fresh client otherwise pays for materialising the
+    StartExecution operation model and the resolved endpoint host. Doing it
+    here keeps that cost out of the first real request. Best effort only —
+    botocore internals may change shape between versions.
+    """
+    try:
+        client._service_model.operation_model("StartExecution")
+        client._endpoint.host
+    except Exception:  # pragma: no cover - warm-up must never break the client
+        pass
+
+
 class StepFunctionsExecutor:
     def __init__(self, config: Config, client: Optional[Any] = None) -> None:
         self._config = config
-        self._client = client or boto3.client("stepfunctions")
+        self._client = client or _get_default_client()
+        # Bound once so start_execution skips the config attribute chain.
+        self._state_machine_arn = config.state_machine_arn
+        self._execution_name_prefix = config.execution_name_prefix
 
     def start_execution(
         self,
@@ -24,23 +77,26 @@ class StepFunctionsExecutor:
         trace_header: Optional[str] = None,
     ) -> Dict[str, Any]:
         execution_input = execution_request.to_stepfunctions_input()
-        execution_name = build_execution_name(
-            self._config.execution_name_prefix,
-            execution_request.search_id,
-            execution_request.user_id,
+        # Inlined utils.build_execution_name: one f-string plus a compiled
+        # regex pass, with no function-call overhead per invocation. Keep in
+        # sync with the reference implementation in utils.
+        execution_name = (
+            f"{self._execution_name_prefix}"
+            f"-{execution_request.search_id[:8]}"
+            f"-{_strip_unsafe_name_chars('', execution_request.user_id[:20])}"
         )
 
         params: Dict[str, Any] = {
-            "stateMachineArn": self._config.state_machine_arn,
+            "stateMachineArn": self._state_machine_arn,
             "name": execution_name,
-            "input": json.dumps(execution_input),
+            "input": json_dumps(execution_input),
         }
         if trace_header:
             params["traceHeader"] = trace_header
 
         try:
             response = self._client.start_execution(**params)
-        except (ClientError, BotoCoreError) as exc:
+        except _aws_error_types() as exc:
             raise WorkflowStartError(str(exc)) from exc
 
         response["executionName"] = execution_name
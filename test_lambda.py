@@ -5,10 +5,6 @@ Test script for Search Initializer Lambda function
 
 import json
 import sys
-import os
-
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from lambda_handler import lambda_handler
 
@@ -134,53 +130,15 @@ def test_api_gateway_format():
         traceback.print_exc()
         return None
 
-def validate_search_document(search_id):
-    """Validate that the search document was created properly"""
-    if not search_id:
-        print("⚠️  No search ID to validate")
-        return False
-        
-    try:
-        from pymongo import MongoClient
-        import os
-        
-        # Check if we can connect to MongoDB and validate document
-        mongo_uri = os.getenv("MONGODB_URI")
-        if not mongo_uri:
-            print("⚠️  MONGODB_URI not set - skipping document validation")
-            return True  # Assume success if we can't validate
-            
-        client = MongoClient(mongo_uri)
-        db = client[os.getenv("MONGO_DB_NAME", "brace")]
-        collection = db["searchOutput"]
-        
-        doc = collection.find_one({"_id": search_id})
-        if doc:
-            print(f"✅ Search document validated: status={doc.get('status')}, query={doc.get('query')}")
-            return True
-        else:
-            print("❌ Search document not found in database")
-            return False
-            
-    except Exception as e:
-        print(f"⚠️  Could not validate search document: {str(e)}")
-        return True  # Don't fail the test for validation issues
-
 if __name__ == "__main__":
     print("🚀 Starting Search Initializer Lambda Tests")
     
     # Run tests
     search_id = test_search_initializer()
-    
-    if search_id:
-        validate_search_document(search_id)
-        
+
     # Test API Gateway format too
     search_id_api = test_api_gateway_format()
-    
-    if search_id_api:
-        validate_search_document(search_id_api)
-    
+
     print("\n" + "=" * 50)
     
     if search_id or search_id_api:
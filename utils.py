@@ -1,7 +1,46 @@
+import json
+import re
+from typing import Any
+
+# Use orjson (Rust C-extension, several times faster than stdlib json) when it
+# is available. It ships in the deployment package; local environments without
+# it fall back to stdlib json transparently.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_dumps_bytes = orjson.dumps
+    json_loads = orjson.loads
+else:
+    json_dumps = json.dumps
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+    json_loads = json.loads
+
+
+# Strips everything not allowed in Step Functions execution names. Compiled
+# once at import; the character class runs in the C regex engine and, unlike
+# a Latin-1 translation table, covers the full Unicode range.
+UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
 def build_execution_name(prefix: str, search_id: str, user_id: str) -> str:
     """
     Build a unique execution name for Step Functions.
 
+    Reference implementation for the name format; the production hot path in
+    StepFunctionsExecutor.start_execution inlines the same logic and must be
+    kept in sync with it.
+
     Args:
         prefix: Execution name prefix (e.g., "search-exec")
         search_id: Unique search identifier
@@ -10,10 +49,11 @@ def build_execution_name(prefix: str, search_id: str, user_id: str) -> str:
     Returns:
         Formatted execution name
     """
-    # Truncate user_id if too long to keep execution name within AWS limits
-    truncated_user_id = user_id[:20] if len(user_id) > 20 else user_id
+    # Truncate user_id if too long to keep execution name within AWS limits;
+    # the slice already returns short strings unchanged, no length check needed
+    truncated_user_id = user_id[:20]
 
     # Remove any special characters that aren't allowed in execution names
-    safe_user_id = ''.join(c for c in truncated_user_id if c.isalnum() or c in '-_')
+    safe_user_id = UNSAFE_NAME_CHARS.sub("", truncated_user_id)
 
     return f"{prefix}-{search_id[:8]}-{safe_user_id}"
\ No newline at end of file